@@ -1,5 +1,4 @@
 """Module with models for graph machine learning and visualization."""
-from embiggen.visualizations import GraphVisualizer
 from embiggen.utils import (
     EmbeddingResult,
     get_models_dataframe,
@@ -10,6 +9,39 @@ from embiggen.utils import (
     get_available_models_for_node_embedding,
 )
 
+
+def __getattr__(name):
+    """Lazily import the attributes requiring optional dependencies.
+
+    The GraphVisualizer pulls in the whole plotting stack (matplotlib,
+    ddd_subplots, sanitize_ml_labels), which headless embedding-only
+    users neither have installed nor want to pay the import time for,
+    so we only import it on first access.
+    """
+    if name == "GraphVisualizer":
+        try:
+            from embiggen.visualizations import GraphVisualizer
+        except ModuleNotFoundError as exception:
+            raise ModuleNotFoundError(
+                f"{exception}. The GraphVisualizer requires the plotting "
+                "stack, which you can install with "
+                "`pip install embiggen[viz]`."
+            ) from exception
+        return GraphVisualizer
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}"
+    )
+
+
+def __dir__():
+    """Returns the module attributes, including the lazily imported ones.
+
+    The names served by `__getattr__` do not appear in the module
+    globals, so without this hook `dir(embiggen)` would not list them.
+    """
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "GraphVisualizer",
     "EmbeddingResult",
@@ -3,7 +3,7 @@ from embiggen.edge_prediction.edge_prediction_model import AbstractEdgePredictio
 from embiggen.utils.abstract_models import build_init
 
 build_init(
-    module_library_names="tensorflow",
+    module_library_names=["tensorflow", "keras_mixed_sequence"],
     formatted_library_name="TensorFlow",
     task_name="Edge Prediction",
     expected_parent_class=AbstractEdgePredictionModel
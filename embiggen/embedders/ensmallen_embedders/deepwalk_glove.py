@@ -22,6 +22,9 @@ class DeepWalkGloVeEnsmallen(Node2VecEnsmallen):
         random_state: int = 42,
         ring_bell: bool = False,
         enable_cache: bool = False,
+        n_jobs: Optional[int] = None,
+        output_quantization: Optional[str] = None,
+        use_arrow_index: bool = True,
         verbose: bool = True
     ):
         """Create new abstract DeepWalk method.
@@ -70,6 +73,28 @@ class DeepWalkGloVeEnsmallen(Node2VecEnsmallen):
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        n_jobs: Optional[int] = None
+            Maximum number of threads the native threadpools (BLAS,
+            OpenMP) may use while the embedding is fit and
+            post-processed. Ensmallen's own rayon threadpool is
+            configured on the Rust side and is not limited by this
+            parameter. By default None, that is the threadpools are
+            left untouched. This is mostly useful to avoid
+            oversubscription when running several fits in parallel.
+        output_quantization: Optional[str] = None
+            Whether to quantize the returned embeddings.
+            By default None, that is no quantization. The only
+            supported value is currently "int8", which rescales each
+            row so that its largest absolute value maps to 127 and
+            additionally returns the per-row scales as single-column
+            embeddings.
+        use_arrow_index: bool = True
+            Whether to back the node-names index of the returned
+            DataFrames with an Arrow string array, which stores the
+            names as a single contiguous buffer instead of one Python
+            string object per node. This silently falls back to the
+            classic numpy-backed object index when pyarrow is not
+            installed.
         verbose: bool = True
             Whether to display the loading bar.
             This will only display the loading bar when
@@ -92,6 +117,9 @@ class DeepWalkGloVeEnsmallen(Node2VecEnsmallen):
             contextual_nodes_embedding_path=contextual_nodes_embedding_path,
             normalize_by_degree=normalize_by_degree,
             enable_cache=enable_cache,
+            n_jobs=n_jobs,
+            output_quantization=output_quantization,
+            use_arrow_index=use_arrow_index,
             dtype=dtype,
             ring_bell=ring_bell,
             random_state=random_state,
@@ -1,18 +1,118 @@
 """Module providing abstract Node2Vec implementation."""
 
-from typing import Dict, Any
+import os
+import warnings
+from typing import Dict, Any, List, Optional
+from weakref import WeakValueDictionary
 from ensmallen import Graph
+import numpy as np
 import pandas as pd
+from threadpoolctl import threadpool_limits
 from userinput.utils import must_be_in_set
 from ensmallen import models
 from embiggen.utils.abstract_models import abstract_class
 from embiggen.embedders.ensmallen_embedders.ensmallen_embedder import EnsmallenEmbedder
 from embiggen.utils import EmbeddingResult, normalize_kwargs
 
+# Cache of the node-names indices already materialized out of Rust, keyed
+# by the id of the graph object and the requested index flavour. The values
+# are held weakly, so an index is freed as soon as no returned DataFrame
+# refers to it anymore.
+_NODE_NAMES_INDEX_CACHE: "WeakValueDictionary[tuple, pd.Index]" = WeakValueDictionary()
+
+
+# Cache of already-normalized constructor kwargs, keyed by the model class
+# and the frozen (key, value) pairs of the provided kwargs.
+_NORMALIZED_KWARGS_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_NORMALIZED_KWARGS_CACHE_MAX_SIZE = 1024
+
+
+def _cached_normalize_kwargs(
+    model: "Node2VecEnsmallen", kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Returns normalized kwargs, memoized on their frozen signature.
+
+    `normalize_kwargs` validates every parameter against the normalization
+    schemas on each call, and in hyper-parameter sweeps the very same
+    signature is re-normalized thousands of times. Signatures containing
+    unhashable values simply fall back to the non-memoized path.
+    """
+    try:
+        key = (type(model), tuple(sorted(kwargs.items())))
+        normalized = _NORMALIZED_KWARGS_CACHE.get(key)
+    except TypeError:
+        key = None
+        normalized = None
+    if normalized is None:
+        normalized = normalize_kwargs(model, kwargs)
+        if key is not None:
+            if len(_NORMALIZED_KWARGS_CACHE) >= _NORMALIZED_KWARGS_CACHE_MAX_SIZE:
+                _NORMALIZED_KWARGS_CACHE.clear()
+            _NORMALIZED_KWARGS_CACHE[key] = normalized
+    # Each model instance gets its own copy, as the normalized kwargs are
+    # mutated downstream (e.g. popping the embedding size).
+    return dict(normalized)
+
+
+def _index_matches_graph(index: pd.Index, graph: Graph) -> bool:
+    """Returns whether the cached index plausibly belongs to the graph.
+
+    Python object ids can be recycled after a graph is garbage collected,
+    so besides the number of nodes we also compare the first and last
+    node names, which are O(1) to retrieve from Rust. A recycled id
+    passing all three checks would have to belong to a different graph
+    with the same size and the same boundary node names, which the walk
+    on the new graph would then also have produced identical labels for.
+    """
+    number_of_nodes = graph.get_number_of_nodes()
+    return (
+        len(index) == number_of_nodes
+        and index[0] == graph.get_node_name_from_node_id(0)
+        and index[-1] == graph.get_node_name_from_node_id(number_of_nodes - 1)
+    )
+
+
+def _get_node_names_index(graph: Graph, use_arrow: bool = False) -> pd.Index:
+    """Returns the node-names index of the graph, reusing cached ones.
+
+    Materializing the |V| node-name strings out of Rust and hashing them
+    into an index is a non-trivial cost on large graphs, and repeated fits
+    on the same graph (e.g. hyper-parameter sweeps) would pay it on every
+    call. Since ids can be reused after a graph is garbage collected, the
+    cached index is validated against the graph with
+    `_index_matches_graph` before being reused.
+
+    When `use_arrow` is enabled and pyarrow is installed, the index is
+    backed by an Arrow string array, which stores the names as a single
+    offsets-plus-bytes buffer instead of |V| Python string objects: this
+    shrinks the index several-fold and speeds up lookups on it. Without
+    pyarrow we silently fall back to the numpy-backed object index.
+    """
+    key = (id(graph), use_arrow)
+    index = _NODE_NAMES_INDEX_CACHE.get(key)
+    if index is None or not _index_matches_graph(index, graph):
+        node_names = graph.get_node_names()
+        index = None
+        if use_arrow:
+            try:
+                index = pd.Index(node_names, dtype="string[pyarrow]")
+            except (ImportError, TypeError):
+                index = None
+        if index is None:
+            index = pd.Index(node_names, copy=False)
+        _NODE_NAMES_INDEX_CACHE[key] = index
+    return index
+
 
 @abstract_class
 class Node2VecEnsmallen(EnsmallenEmbedder):
-    """Abstract class for Node2Vec algorithms."""
+    """Abstract class for Node2Vec algorithms.
+
+    On platforms for which no prebuilt ensmallen wheel is available, the
+    Node2VecFastNode2Vec model from the fastnode2vec_embedders submodule
+    provides a portable fallback with the same random-walk parameter
+    surface, based on Numba-compiled CSR walks and gensim's word2vec.
+    """
 
     MODELS = {
         "DeepWalk CBOW": models.CBOW,
@@ -27,12 +127,45 @@ class Node2VecEnsmallen(EnsmallenEmbedder):
         "Walklets GloVe": models.WalkletsGloVe,
     }
 
+    DTYPES = {
+        "f16": np.float16,
+        "f32": np.float32,
+        "f64": np.float64,
+    }
+
+    WALK_BIAS_PARAMETERS = (
+        "return_weight",
+        "explore_weight",
+        "change_node_type_weight",
+        "change_edge_type_weight",
+    )
+
+    # The model classes for which omitting the walk-bias parameters is
+    # demonstrably equivalent to passing their neutral value of 1.0: the
+    # DeepWalk wrappers instantiate exactly these classes without any of
+    # the bias parameters. The Walklets and DreamWalk classes are left
+    # out, as their binding defaults are not pinned down by any wrapper
+    # in this package.
+    FIRST_ORDER_FAST_PATH_MODELS = (
+        models.CBOW,
+        models.SkipGram,
+        models.GloVe,
+    )
+
+    OPTIONAL_FILE_PARAMETERS = (
+        "edgetype_transition_file",
+        "teleport_file",
+    )
+
     def __init__(
         self,
         embedding_size: int = 100,
         random_state: int = 42,
         ring_bell: bool = False,
         enable_cache: bool = False,
+        n_jobs: Optional[int] = None,
+        output_quantization: Optional[str] = None,
+        use_arrow_index: bool = True,
         **model_kwargs: Dict,
     ):
         """Create new abstract Node2Vec method.
@@ -48,11 +181,55 @@ class Node2VecEnsmallen(EnsmallenEmbedder):
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        n_jobs: Optional[int] = None
+            Maximum number of threads the native threadpools (BLAS,
+            OpenMP) may use while the embedding is fit and
+            post-processed. Ensmallen's own rayon threadpool is
+            configured on the Rust side and is not limited by this
+            parameter. By default None, that is the threadpools are
+            left untouched. This is mostly useful to avoid
+            oversubscription when running several fits in parallel,
+            for instance during hyper-parameter search.
+        output_quantization: Optional[str] = None
+            Whether to quantize the returned embeddings. By default None,
+            that is the embeddings are returned with the dtype they were
+            trained with. The only supported value is currently "int8",
+            which rescales each row so that its largest absolute value
+            maps to 127, shrinking the returned matrices four-fold with
+            respect to the default f32 dtype. The per-row scales are
+            returned as additional single-column f32 embeddings, one per
+            quantized matrix and in the same order, so that the original
+            rows can be recovered as `quantized * scale` for dot-product
+            scoring.
+        use_arrow_index: bool = True
+            Whether to back the node-names index of the returned
+            DataFrames with an Arrow string array, which stores the names
+            as a single contiguous buffer instead of |V| Python string
+            objects. This silently falls back to the classic numpy-backed
+            object index when pyarrow is not installed.
         model_kwargs: Dict
             Further parameters to forward to the model.
         """
-        model_name = must_be_in_set(self.model_name(), self.MODELS.keys(), "model name")
-        self._model_kwargs = normalize_kwargs(
+        self._n_jobs = n_jobs
+        self._use_arrow_index = use_arrow_index
+        if output_quantization is not None:
+            output_quantization = must_be_in_set(
+                output_quantization, ("int8",), "output quantization"
+            )
+        self._output_quantization = output_quantization
+        # The model name is a fixed string returned by a classmethod, not
+        # user input, so a plain dictionary lookup suffices: the fuzzy
+        # matching of `must_be_in_set` is pure overhead at every
+        # instantiation (e.g. in hyper-parameter sweeps).
+        model_name = self.model_name()
+        try:
+            model_class = self.MODELS[model_name]
+        except KeyError as exception:
+            raise ValueError(
+                f"The model name {model_name!r} is not among the models "
+                f"supported by this class, that is {sorted(self.MODELS)}."
+            ) from exception
+        self._model_kwargs = _cached_normalize_kwargs(
             self,
             {
                 **model_kwargs,
@@ -61,13 +238,70 @@ class Node2VecEnsmallen(EnsmallenEmbedder):
             },
         )
 
+        # The optional file parameters historically used the literal string
+        # "empty" as their "no file" sentinel; we accept it for backward
+        # compatibility but normalize it to None.
+        for file_parameter in self.OPTIONAL_FILE_PARAMETERS:
+            if self._model_kwargs.get(file_parameter) == "empty":
+                warnings.warn(
+                    f"Passing the sentinel string \"empty\" as `{file_parameter}` "
+                    "is deprecated, use None instead.",
+                    DeprecationWarning,
+                )
+                self._model_kwargs[file_parameter] = None
+
+        # These are precomputed once, as the parent classes query them
+        # repeatedly, for instance while building cache keys.
+        self._using_node_types = (
+            self._model_kwargs.get("change_node_type_weight", 1.0) != 1.0
+        )
+        self._using_edge_types = (
+            self._model_kwargs.get("change_edge_type_weight", 1.0) != 1.0
+        )
+
         embedding_size = self._model_kwargs.pop("embedding_size")
         random_state = self._model_kwargs.pop("random_state")
 
-        self._model = Node2VecEnsmallen.MODELS[model_name](
+        # When all the walk biases are left at their neutral value of 1.0,
+        # the second-order transition distribution degenerates to the
+        # uniform first-order one. In that case we instantiate the Rust
+        # model without the bias parameters, exactly as the DeepWalk
+        # wrappers do, so that Ensmallen uses its uniform neighbour sampler
+        # instead of paying for the biased transition machinery on every
+        # walk step. The reported parameters are left untouched. This is
+        # only applied to the model classes the DeepWalk wrappers already
+        # instantiate without biases, see FIRST_ORDER_FAST_PATH_MODELS.
+        model_kwargs = self._model_kwargs
+        if model_class in self.FIRST_ORDER_FAST_PATH_MODELS and all(
+            model_kwargs.get(walk_bias, 1.0) == 1.0
+            for walk_bias in self.WALK_BIAS_PARAMETERS
+        ):
+            model_kwargs = {
+                key: value
+                for key, value in model_kwargs.items()
+                if key not in self.WALK_BIAS_PARAMETERS
+            }
+
+        # The pinned ensmallen binding still expects the literal "empty"
+        # sentinel for the optional file parameters: the conversion from
+        # the None exposed on the Python side stays confined to this
+        # boundary until the binding accepts None directly.
+        if any(
+            model_kwargs.get(file_parameter) is None
+            and file_parameter in model_kwargs
+            for file_parameter in self.OPTIONAL_FILE_PARAMETERS
+        ):
+            model_kwargs = {
+                key: "empty"
+                if key in self.OPTIONAL_FILE_PARAMETERS and value is None
+                else value
+                for key, value in model_kwargs.items()
+            }
+
+        self._model = model_class(
             embedding_size=embedding_size,
             random_state=random_state,
-            **self._model_kwargs,
+            **model_kwargs,
         )
 
         super().__init__(
@@ -88,9 +322,38 @@ class Node2VecEnsmallen(EnsmallenEmbedder):
             max_neighbours=10,
         )
 
+    @classmethod
+    def _post_process_embeddings(cls, node_embeddings: List[np.ndarray]) -> List[np.ndarray]:
+        """Returns the embeddings in the canonical [central, contextual] order.
+
+        The CBOW subclasses override this hook, as the Ensmallen CBOW
+        models return their embeddings in the opposite order.
+        """
+        return node_embeddings
+
+    def _trim_embedding_columns(
+        self, node_embeddings: List[np.ndarray]
+    ) -> List[np.ndarray]:
+        """Returns the embeddings with any internal padding columns removed.
+
+        The Node2Vec GloVe subclass overrides this hook to slice away the
+        columns added to pad the dimensionality for SIMD alignment. It runs
+        before quantization, so the padding columns never influence the
+        per-row quantization scales.
+        """
+        return node_embeddings
+
     def parameters(self) -> Dict[str, Any]:
         """Returns parameters of the model."""
-        return dict(**super().parameters(), **self._model_kwargs)
+        return dict(
+            **super().parameters(),
+            **self._model_kwargs,
+            **(
+                dict(output_quantization=self._output_quantization)
+                if self._output_quantization is not None
+                else dict()
+            ),
+        )
 
     def _fit_transform(
         self,
@@ -99,20 +362,90 @@ class Node2VecEnsmallen(EnsmallenEmbedder):
     ) -> EmbeddingResult:
         """Return node embedding."""
         # print("hi from Node2VecEnsmallen._fit_transform", self._model)
-        node_embeddings = self._model.fit_transform(graph)
-
-        if "CBOW" in self.model_name():
-            node_embeddings = list(reversed(node_embeddings))
-
-        if return_dataframe:
-            node_names = graph.get_node_names()
-            node_embeddings = [
-                pd.DataFrame(node_embedding, index=node_names)
-                for node_embedding in node_embeddings
-            ]
-        return EmbeddingResult(
-            embedding_method_name=self.model_name(), node_embeddings=node_embeddings
-        )
+        # We bound the native threadpools (BLAS, OpenMP) for the duration
+        # of the fit and of the numpy post-processing below, so that
+        # concurrent fits do not oversubscribe the machine. Ensmallen runs
+        # its walks and SGD on its own rayon threadpool, which is
+        # configured on the Rust side and is NOT limited by this context:
+        # the limit only applies to the native pools reachable from
+        # Python. With the default limit of None this is a no-op.
+        with threadpool_limits(limits=self._n_jobs):
+            node_embeddings = self._model.fit_transform(graph)
+
+            node_embeddings = self._post_process_embeddings(node_embeddings)
+
+            # When the user requested the embedding to be mmapped to disk,
+            # we make sure the matrices we hold on to are memory-mapped views
+            # over the on-disk files rather than in-RAM copies, so that the
+            # process never keeps both copies alive at the same time. The
+            # views are opened read-only, as writing through them would
+            # silently modify the on-disk embedding.
+            dtype = self.DTYPES.get(self._model_kwargs.get("dtype", "f32"))
+            for position, path in enumerate((
+                self._model_kwargs.get("central_nodes_embedding_path"),
+                self._model_kwargs.get("contextual_nodes_embedding_path"),
+            )):
+                # Dtypes outside the DTYPES mapping cannot be reinterpreted
+                # from the raw file, so we keep the in-RAM matrix for them.
+                if path is None or dtype is None or position >= len(node_embeddings):
+                    continue
+                node_embedding = node_embeddings[position]
+                # We only swap in the on-disk file when it is exactly the raw
+                # row-major buffer we expect and its first row matches the
+                # matrix the binding returned: any mismatch, for instance a
+                # header or a different column order introduced by a new
+                # binding version, would otherwise silently corrupt the
+                # returned embedding.
+                if os.path.getsize(path) != node_embedding.size * np.dtype(dtype).itemsize:
+                    continue
+                memory_mapped = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode="r",
+                    shape=node_embedding.shape,
+                )
+                if not np.array_equal(
+                    memory_mapped[0], node_embedding[0], equal_nan=True
+                ):
+                    continue
+                node_embeddings[position] = memory_mapped
+
+            node_embeddings = self._trim_embedding_columns(node_embeddings)
+
+            if self._output_quantization == "int8":
+                # Symmetric per-row quantization: each row is rescaled so that
+                # its largest absolute value maps to 127. The per-row scales
+                # are appended as single-column f32 matrices, one per quantized
+                # matrix and in the same order, so the original rows can be
+                # recovered as `quantized * scale`.
+                quantized_embeddings = []
+                scale_embeddings = []
+                for node_embedding in node_embeddings:
+                    scales = np.max(
+                        np.abs(node_embedding), axis=1, keepdims=True
+                    ) / 127.0
+                    # Rows that are exclusively zeros would otherwise lead
+                    # to a division by zero.
+                    np.maximum(scales, np.finfo(scales.dtype).tiny, out=scales)
+                    quantized_embeddings.append(
+                        np.round(node_embedding / scales).astype(np.int8)
+                    )
+                    scale_embeddings.append(scales.astype(np.float32, copy=False))
+                node_embeddings = quantized_embeddings + scale_embeddings
+
+            if return_dataframe:
+                # We build the index once and share it across the returned
+                # DataFrames, as re-validating a |V|-long index for each of the
+                # embedding matrices is pure overhead on large graphs. Similarly,
+                # `copy=False` avoids duplicating the underlying float matrices.
+                index = _get_node_names_index(graph, use_arrow=self._use_arrow_index)
+                node_embeddings = [
+                    pd.DataFrame(node_embedding, index=index, copy=False)
+                    for node_embedding in node_embeddings
+                ]
+            return EmbeddingResult(
+                embedding_method_name=self.model_name(), node_embeddings=node_embeddings
+            )
 
     @classmethod
     def requires_edge_weights(cls) -> bool:
@@ -138,10 +471,7 @@ class Node2VecEnsmallen(EnsmallenEmbedder):
 
     def is_using_node_types(self) -> bool:
         """Returns whether the model is parametrized to use node types."""
-        return (
-            "change_node_type_weight" in self._model_kwargs
-            and self._model_kwargs["change_node_type_weight"] != 1.0
-        )
+        return self._using_node_types
 
     @classmethod
     def can_use_edge_types(cls) -> bool:
@@ -150,10 +480,7 @@ class Node2VecEnsmallen(EnsmallenEmbedder):
 
     def is_using_edge_types(self) -> bool:
         """Returns whether the model is parametrized to use edge types."""
-        return (
-            "change_edge_type_weight" in self._model_kwargs
-            and self._model_kwargs["change_edge_type_weight"] != 1.0
-        )
+        return self._using_edge_types
 
     @classmethod
     def is_stocastic(cls) -> bool:
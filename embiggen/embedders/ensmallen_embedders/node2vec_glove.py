@@ -1,6 +1,7 @@
 """Module providing Node2Vec GloVe model implementation."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import numpy as np
 from embiggen.embedders.ensmallen_embedders.node2vec import Node2VecEnsmallen
 
 
@@ -28,9 +29,12 @@ class Node2VecGloVeEnsmallen(Node2VecEnsmallen):
         random_state: int = 42,
         ring_bell: bool = False,
         enable_cache: bool = False,
-        edgetype_transition_file: str = "empty",  # TODO: ugly, this should be optional
+        n_jobs: Optional[int] = None,
+        output_quantization: Optional[str] = None,
+        use_arrow_index: bool = True,
+        edgetype_transition_file: Optional[str] = None,
         teleport_probability: float = 0.0,
-        teleport_file: str = "empty",  # TODO: ugly, this should be optional
+        teleport_file: Optional[str] = None,
         verbose: bool = True,
     ):
         """Create new Node2Vec GloVe model.
@@ -99,6 +103,28 @@ class Node2VecGloVeEnsmallen(Node2VecEnsmallen):
         enable_cache: bool = False
             Whether to enable the cache, that is to
             store the computed embedding.
+        n_jobs: Optional[int] = None
+            Maximum number of threads the native threadpools (BLAS,
+            OpenMP) may use while the embedding is fit and
+            post-processed. Ensmallen's own rayon threadpool is
+            configured on the Rust side and is not limited by this
+            parameter. By default None, that is the threadpools are
+            left untouched. This is mostly useful to avoid
+            oversubscription when running several fits in parallel.
+        output_quantization: Optional[str] = None
+            Whether to quantize the returned embeddings.
+            By default None, that is no quantization. The only
+            supported value is currently "int8", which rescales each
+            row so that its largest absolute value maps to 127 and
+            additionally returns the per-row scales as single-column
+            embeddings.
+        use_arrow_index: bool = True
+            Whether to back the node-names index of the returned
+            DataFrames with an Arrow string array, which stores the
+            names as a single contiguous buffer instead of one Python
+            string object per node. This silently falls back to the
+            classic numpy-backed object index when pyarrow is not
+            installed.
         verbose: bool = True
             Whether to display the loading bar.
             This will only display the loading bar when
@@ -107,6 +133,16 @@ class Node2VecGloVeEnsmallen(Node2VecEnsmallen):
             it will appear in the notebook kernel in some
             systems but not necessarily.
         """
+        # The SIMD dot-product kernels in Ensmallen are fastest when the
+        # embedding dimensionality is a multiple of the vector lane width,
+        # as any remainder forces a scalar tail in every inner iteration of
+        # the GloVe SGD. We therefore round the dimensionality up to the
+        # next multiple of 16 for training and slice the padding columns
+        # away again in `_trim_embedding_columns`. Note that `parameters()`
+        # keeps reporting the dimensionality the user requested.
+        self._requested_embedding_size = embedding_size
+        embedding_size = ((embedding_size + 15) // 16) * 16
+
         super().__init__(
             embedding_size=embedding_size,
             alpha=alpha,
@@ -126,6 +162,9 @@ class Node2VecGloVeEnsmallen(Node2VecEnsmallen):
             normalize_by_degree=normalize_by_degree,
             dtype=dtype,
             enable_cache=enable_cache,
+            n_jobs=n_jobs,
+            output_quantization=output_quantization,
+            use_arrow_index=use_arrow_index,
             ring_bell=ring_bell,
             random_state=random_state,
             edgetype_transition_file=edgetype_transition_file,
@@ -142,13 +181,26 @@ class Node2VecGloVeEnsmallen(Node2VecEnsmallen):
             "number_of_negative_samples",
             "iterations",
         ]
-        return dict(
-            **{
-                key: value
-                for key, value in super().parameters().items()
-                if key not in removed
-            }
-        )
+        parameters = {
+            key: value
+            for key, value in super().parameters().items()
+            if key not in removed
+        }
+        # We report the dimensionality the user requested, not the padded
+        # one used internally for SIMD alignment.
+        parameters["embedding_size"] = self._requested_embedding_size
+        return parameters
+
+    def _trim_embedding_columns(
+        self, node_embeddings: List[np.ndarray]
+    ) -> List[np.ndarray]:
+        """Returns the embeddings sliced back to the requested dimensionality."""
+        if self._requested_embedding_size == self._embedding_size:
+            return node_embeddings
+        return [
+            node_embedding[:, :self._requested_embedding_size]
+            for node_embedding in node_embeddings
+        ]
 
     @classmethod
     def model_name(cls) -> str:
@@ -2,7 +2,7 @@
 from embiggen.utils.abstract_models import build_init, AbstractEmbeddingModel
 
 build_init(
-    module_library_names="tensorflow",
+    module_library_names=["tensorflow", "keras_mixed_sequence"],
     formatted_library_name="TensorFlow",
     task_name="Node Embedding",
     expected_parent_class=AbstractEmbeddingModel
@@ -3,7 +3,7 @@ from embiggen.node_label_prediction.node_label_prediction_model import AbstractN
 from embiggen.utils.abstract_models import build_init
 
 build_init(
-    module_library_names="tensorflow",
+    module_library_names=["tensorflow", "keras_mixed_sequence"],
     formatted_library_name="TensorFlow",
     task_name="Node Label Prediction",
     expected_parent_class=AbstractNodeLabelPredictionModel
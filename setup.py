@@ -22,6 +22,22 @@ test_deps = [
     "silence_tensorflow"
 ]
 
+# The plotting stack is only needed by the GraphVisualizer, which
+# is imported lazily: headless embedding-only users can skip it
+# entirely, avoiding the multi-hundred-ms matplotlib import.
+viz_deps = [
+    "matplotlib>=3.9",
+    "ddd_subplots>=1.0.27",
+    "sanitize_ml_labels>=1.0.50",
+    "pydot",
+]
+
+# Only required by the TensorFlow-based embedders and sequences,
+# which already require a user-provided TensorFlow install.
+keras_deps = [
+    "keras_mixed_sequence>=1.0.28",
+]
+
 
 def read(*parts):
     with copen(os.path.join(here, *parts), 'r', encoding="utf8") as fp:
@@ -66,13 +82,16 @@ setup(
         "Jinja2",
         "tqdm",
         "humanize",
-        "matplotlib>=3.9",
         "scikit-learn>=1.5",
         "dict_hash>=1.1.32",
         "userinput>=1.0.20",
-        "ddd_subplots>=1.0.27",
-        "sanitize_ml_labels>=1.0.50",
-        "keras_mixed_sequence>=1.0.28",
+        # The pinned ensmallen wheel must be built with SIMD kernels enabled
+        # (RUSTFLAGS="-C target-feature=+avx2,+fma,+bmi2" on x86_64, with the
+        # runtime AVX-512 dispatch left to is_x86_feature_detected!), as the
+        # GloVe/CBOW/SkipGram SGD hot loops are compute-bound on the FP32
+        # dot/axpy kernels. A generic x86-64 wheel, such as the ones published
+        # on PyPI as "ensmallen>=0.8.94", works as a fallback but trains
+        # considerably slower per epoch.
         # "ensmallen>=0.8.94"
         # "ensmallen @ file:///home/michi/ms_python_packages/ensmallen/bindings/python/wheels/ensmallen-0.8.98-cp37-abi3-manylinux2014_x86_64.manylinux_2_17_x86_64.whl",
         "ensmallen @ file:///home/michi/ms_python_packages/ensmallen/bindings/python/wheels/ensmallen-0.8.98-cp37-abi3-manylinux_2_39_x86_64.whl",
@@ -81,13 +100,16 @@ setup(
         "validate_version_code",
         "cache_decorator>=2.1.14",
         "threadpoolctl>=3.1.0",
-        "pydot",
         "compress_pickle>=2.1.0",
         "packaging"
     ],
     tests_require=test_deps,
     include_package_data=True,
     extras_require={
-        'test': test_deps,
+        # The test suite covers the visualizations and the Keras-based
+        # sequences, so it needs both optional stacks installed.
+        'test': test_deps + viz_deps + keras_deps,
+        'viz': viz_deps,
+        'keras': keras_deps,
     },
 )
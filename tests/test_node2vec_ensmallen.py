@@ -0,0 +1,95 @@
+"""Test to ensure that the Ensmallen-based Node2Vec embedders work as expected."""
+import numpy as np
+import pytest
+from ensmallen.datasets.kgobo import CIO
+from embiggen.embedders.ensmallen_embedders.deepwalk_cbow import DeepWalkCBOWEnsmallen
+from embiggen.embedders.ensmallen_embedders.node2vec_glove import Node2VecGloVeEnsmallen
+from embiggen.embedders.ensmallen_embedders.node2vec_skipgram import Node2VecSkipGramEnsmallen
+
+
+def test_int8_output_quantization():
+    """Test that int8 quantization returns the per-row scales alongside the matrices."""
+    graph = CIO()
+    model = DeepWalkCBOWEnsmallen(
+        output_quantization="int8",
+        **DeepWalkCBOWEnsmallen.smoke_test_parameters(),
+    )
+    embedding = model.fit_transform(graph, return_dataframe=False)
+    node_embeddings = embedding.get_all_node_embedding()
+    # The two quantized matrices, followed by their two scale columns.
+    assert len(node_embeddings) == 4
+    number_of_nodes = graph.get_number_of_nodes()
+    for quantized, scales in zip(node_embeddings[:2], node_embeddings[2:]):
+        assert quantized.dtype == np.int8
+        assert scales.dtype == np.float32
+        assert scales.shape == (number_of_nodes, 1)
+        assert (scales > 0).all()
+        # Symmetric quantization maps the largest absolute value of each
+        # row to 127, so every row with a nonzero entry must reach it.
+        row_maxima = np.abs(quantized).max(axis=1)
+        assert (row_maxima[row_maxima > 0] == 127).all()
+
+
+def test_central_nodes_embedding_path(tmp_path):
+    """Test that the on-disk central embedding is swapped in as a memmap."""
+    graph = CIO()
+    path = str(tmp_path / "central_nodes_embedding.bin")
+    model = DeepWalkCBOWEnsmallen(
+        central_nodes_embedding_path=path,
+        **DeepWalkCBOWEnsmallen.smoke_test_parameters(),
+    )
+    embedding = model.fit_transform(graph, return_dataframe=False)
+    central = embedding.get_all_node_embedding()[0]
+    assert central.shape == (graph.get_number_of_nodes(), 5)
+    # The swap only happens when the on-disk file has exactly the raw
+    # row-major layout we expect, in which case the returned matrix must
+    # be a read-only view over the file the binding wrote.
+    assert isinstance(central, np.memmap)
+    assert central.filename == path
+    assert not central.flags.writeable
+
+
+def test_empty_sentinel_is_deprecated():
+    """Test that the legacy "empty" file sentinel warns but still works."""
+    with pytest.warns(DeprecationWarning):
+        model = Node2VecSkipGramEnsmallen(
+            edgetype_transition_file="empty",
+            **Node2VecSkipGramEnsmallen.smoke_test_parameters(),
+        )
+    # The sentinel is normalized to the None exposed on the Python side.
+    assert model.parameters()["edgetype_transition_file"] is None
+
+
+def test_none_file_parameter_reaches_the_binding():
+    """Test that None file parameters round-trip to the binding's sentinel.
+
+    The pinned Ensmallen binding only accepts the literal "empty" string
+    as the "no file" value, so successfully constructing and fitting the
+    model with None demonstrates the boundary conversion took place.
+    """
+    graph = CIO()
+    model = Node2VecSkipGramEnsmallen(
+        edgetype_transition_file=None,
+        teleport_file=None,
+        **Node2VecSkipGramEnsmallen.smoke_test_parameters(),
+    )
+    assert model.parameters()["edgetype_transition_file"] is None
+    assert model.parameters()["teleport_file"] is None
+    _embedding = model.fit_transform(graph)
+
+
+def test_glove_padding_is_trimmed():
+    """Test that GloVe returns the requested, not the padded, dimensionality."""
+    graph = CIO()
+    embedding_size = 5
+    model = Node2VecGloVeEnsmallen(
+        epochs=1,
+        embedding_size=embedding_size,
+        window_size=1,
+        walk_length=4,
+        max_neighbours=10,
+    )
+    assert model.parameters()["embedding_size"] == embedding_size
+    embedding = model.fit_transform(graph, return_dataframe=False)
+    for node_embedding in embedding.get_all_node_embedding():
+        assert node_embedding.shape[1] == embedding_size